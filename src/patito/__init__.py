@@ -1,4 +1,8 @@
 """Patito, a data-modelling library built on top of polars and pydantic."""
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, List
+
 from polars import Expr, Series, col
 
 from patito import exceptions, sql
@@ -6,7 +10,16 @@ from patito.exceptions import ValidationError
 from patito.polars import DataFrame, LazyFrame
 from patito.pydantic import Field, Model
 
-_DUCKDB_AVAILABLE = False
+if TYPE_CHECKING:
+    from patito import duckdb  # noqa: F401
+    from patito.duckdb import Database, Relation, RelationSource  # noqa: F401
+
+# The DuckDB integration is imported lazily on first attribute access, see
+# __getattr__ below, as it pulls in pyarrow and numpy at import time.
+_DUCKDB_AVAILABLE = all(
+    find_spec(name) is not None for name in ("duckdb", "numpy", "pyarrow")
+)
+_DUCKDB_ATTRIBUTES = ("Database", "Relation", "RelationSource")
 field = col("_")
 __all__ = [
     "DataFrame",
@@ -23,17 +36,38 @@ __all__ = [
     "sql",
 ]
 
-try:
-    from patito.duckdb import Database, Relation, RelationSource
-
-    _DUCKDB_AVAILABLE = True
-    __all__ += [
-        "Database",
-        "Relation",
-        "RelationSource",
-    ]
-except ImportError:  # pragma: no cover
-    pass
+if _DUCKDB_AVAILABLE:  # pragma: no cover
+    __all__ += list(_DUCKDB_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """
+    Import the DuckDB integration on first access of one of its attributes.
+
+    Args:
+        name: Name of the module attribute being accessed.
+
+    Returns:
+        The ``patito.duckdb`` module or the requested attribute defined in it.
+
+    Raises:
+        AttributeError: If the attribute does not exist or DuckDB is not installed.
+    """
+    if _DUCKDB_AVAILABLE and (name == "duckdb" or name in _DUCKDB_ATTRIBUTES):
+        module = import_module("patito.duckdb")
+        return module if name == "duckdb" else getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """
+    Include the lazily imported DuckDB attributes in dir(patito).
+
+    Returns:
+        Sorted list of the attribute names of the patito module.
+    """
+    lazy_attributes = ["duckdb", *_DUCKDB_ATTRIBUTES] if _DUCKDB_AVAILABLE else []
+    return sorted({*globals(), *lazy_attributes})
 
 
 try:
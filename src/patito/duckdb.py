@@ -1769,6 +1769,10 @@ class Relation(Generic[ModelType]):
         """
         Return a polars DataFrame representation of relation object.
 
+        The Arrow record batches produced by DuckDB are handed over to polars without
+        being concatenated, so large results may consist of several chunks. Invoke
+        ``DataFrame.rechunk()`` on the result if contiguous memory is required.
+
         Returns: A ``patito.DataFrame`` object which inherits from ``polars.DataFrame``.
 
         Example:
@@ -1791,13 +1795,7 @@ class Relation(Generic[ModelType]):
         self._relation = self._relation.project("*")
         arrow_table = cast(pa.lib.Table, self._relation.to_arrow_table())
         try:
-            # We cast `INTEGER`-typed columns to `pl.Int64` when converting to Polars
-            # because polars is much more eager to store integer Series as 64-bit
-            # integers. Otherwise there must be done a lot of manual casting whenever
-            # you cross the boundary between DuckDB and polars.
-            return DataFrame._from_arrow(arrow_table).with_column(
-                pl.col(pl.Int32).cast(pl.Int64)
-            )
+            dataframe: DataFrame = DataFrame._from_arrow(arrow_table, rechunk=False)
         except pa.ArrowInvalid:  # pragma: no cover
             # Empty relations with enum columns can sometimes produce errors.
             # As a last-ditch effort, we convert such columns to VARCHAR.
@@ -1809,9 +1807,17 @@ class Relation(Generic[ModelType]):
             ]
             non_enum_relation = self._relation.project(", ".join(casted_columns))
             arrow_table = non_enum_relation.to_arrow_table()
-            return DataFrame._from_arrow(arrow_table).with_column(
-                pl.col(pl.Int32).cast(pl.Int64)
-            )
+            dataframe = DataFrame._from_arrow(arrow_table, rechunk=False)
+
+        # Release the Arrow buffers which polars did not adopt before casting, so
+        # that they do not stay alive alongside the casted columns.
+        del arrow_table
+
+        # We cast `INTEGER`-typed columns to `pl.Int64` when converting to Polars
+        # because polars is much more eager to store integer Series as 64-bit
+        # integers. Otherwise there must be done a lot of manual casting whenever
+        # you cross the boundary between DuckDB and polars.
+        return dataframe.with_column(pl.col(pl.Int32).cast(pl.Int64))
 
     def to_series(self) -> pl.Series:
         """
@@ -1838,7 +1844,9 @@ class Relation(Generic[ModelType]):
                 f"{self.__class__.__name__}.to_series() was invoked on a relation with "
                 f"{len(self._relation.columns)} columns, while exactly 1 is required!"
             )
-        dataframe: DataFrame = DataFrame._from_arrow(self._relation.to_arrow_table())
+        dataframe: DataFrame = DataFrame._from_arrow(
+            self._relation.to_arrow_table(), rechunk=False
+        )
         return dataframe.to_series(index=0).alias(name=self.columns[0])
 
     def union(self: RelationType, other: RelationSource) -> RelationType:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import itertools
+import sys
 from collections.abc import Iterable
 from datetime import date, datetime
 from typing import (
@@ -27,14 +28,9 @@ from typing_extensions import Literal, get_args
 from patito.polars import DataFrame, LazyFrame
 from patito.validators import validate
 
-try:
+if TYPE_CHECKING:
     import pandas as pd
 
-    _PANDAS_AVAILABLE = True
-except ImportError:
-    _PANDAS_AVAILABLE = False
-
-if TYPE_CHECKING:
     import patito.polars
     from patito.duckdb import DuckDBSQLType
 
@@ -597,12 +593,14 @@ class Model(BaseModel, metaclass=ModelMetaclass):
             >>> Product.from_row(df, validate=False)
             Product(product_id='1', name='product name', price='1.22')
         """
+        # pandas objects can only be passed in if pandas has already been imported
+        pandas = sys.modules.get("pandas")
         if isinstance(row, pl.DataFrame):
             dataframe = row
-        elif _PANDAS_AVAILABLE and isinstance(row, pd.DataFrame):
+        elif pandas is not None and isinstance(row, pandas.DataFrame):
             dataframe = pl.DataFrame._from_pandas(row)
-        elif _PANDAS_AVAILABLE and isinstance(row, pd.Series):  # type: ignore[unreachable]
-            return cls(**dict(row.items()))  # type: ignore[unreachable]
+        elif pandas is not None and isinstance(row, pandas.Series):
+            return cls(**dict(row.items()))
         else:
             raise TypeError(f"{cls.__name__}.from_row not implemented for {type(row)}.")
         return cls._from_polars(dataframe=dataframe, validate=validate)
@@ -915,9 +913,7 @@ class Model(BaseModel, metaclass=ModelMetaclass):
             0          -1  product A              dry
             1          -1  product B              dry
         """
-        if not _PANDAS_AVAILABLE:
-            # Re-trigger the import error, but this time don't catch it
-            raise ImportError("No module named 'pandas'")
+        import pandas as pd
 
         if not isinstance(data, dict):
             if columns is None:
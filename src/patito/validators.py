@@ -24,14 +24,9 @@ if sys.version_info >= (3, 10):  # pragma: no cover
 else:
     UNION_TYPES = (Union,)
 
-try:
+if TYPE_CHECKING:
     import pandas as pd
 
-    _PANDAS_AVAILABLE = True
-except ImportError:
-    _PANDAS_AVAILABLE = False
-
-if TYPE_CHECKING:
     from patito import Model
 
 
@@ -308,7 +303,9 @@ def validate(
     Raises:
         ValidationError: If the given dataframe does not match the given schema.
     """
-    if _PANDAS_AVAILABLE and isinstance(dataframe, pd.DataFrame):
+    # pandas objects can only be passed in if pandas has already been imported
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(dataframe, pandas.DataFrame):
         polars_dataframe = pl.from_pandas(dataframe)
     else:
         polars_dataframe = cast(pl.DataFrame, dataframe)
@@ -1,5 +1,7 @@
 """Tests for patito.Database."""
 import enum
+import subprocess  # noqa: S404
+import sys
 from typing import Optional
 
 import polars as pl
@@ -280,3 +282,16 @@ def test_execute():
         .to_df()
         .frame_equal(pt.DataFrame({"a": [2, 5, 8], "b": [3, 6, 9], "c": [4, 7, 10]}))
     )
+
+
+def test_lazy_import_of_duckdb_integration():
+    """Importing patito should not import the DuckDB integration until it is used."""
+    script = (
+        "import sys; import patito as pt; "
+        "assert 'patito.duckdb' not in sys.modules; "
+        "assert 'pyarrow' not in sys.modules; "
+        "assert 'Database' in dir(pt); "
+        "assert pt.Database is pt.duckdb.Database; "
+        "assert 'patito.duckdb' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)  # noqa: S603
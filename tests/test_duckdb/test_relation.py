@@ -846,6 +846,15 @@ def test_series_vs_dataframe_behavior():
         relation.to_series()
 
 
+def test_to_df_does_not_rechunk_arrow_batches():
+    """Relation.to_df() should hand DuckDB's record batches to polars as-is."""
+    relation = pt.Relation("select * from range(2000001) as t(a)")
+    df = relation.to_df()
+    assert df.height == 2_000_001
+    assert df.n_chunks() > 1
+    assert df.rechunk().n_chunks() == 1
+
+
 def test_converting_enum_column_to_polars():
     """Enum types should be convertible to polars categoricals."""
 